@@ -2,6 +2,9 @@
 Copilot Bridge Client for Python
 Connects to the VS Code Copilot API Bridge extension via HTTP.
 
+Optional:
+    pip install orjson      # faster JSON encoding/decoding
+
 Usage:
     from copilot_client import CopilotClient
 
@@ -22,25 +25,65 @@ Usage:
 
     # Choose model
     response = client.chat("Hello", model="gpt-4o-mini")
+
+    # Serialize once, send many times
+    prepared = client.prepare("Hello", model="gpt-4o")
+    for _ in range(3):
+        print(client.send(prepared).content)
+
+    # Answer repeated identical requests from memory (chat / chat_full only)
+    client = CopilotClient(cache_size=128, cache_ttl=600)
 """
 
 from __future__ import annotations
 
+import hashlib
+import http.client
 import json
-import urllib.request
-import urllib.error
-from typing import Generator, Optional, Union
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generator, Iterator, Optional, Union
 
 from copilot_interface import (
     ICopilotClient, ChatMessage, ChatResponse, ModelInfo, StatusResponse,
+    _JSON_FENCE_RE, _extract_json_span, _ttl_cached,
 )
 
+# orjson is optional: it parses/serializes straight from/to bytes and is
+# considerably faster than the stdlib on every request and SSE frame.
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+
+    def _dumps_sorted(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def _dumps_sorted(obj) -> bytes:
+        return json.dumps(obj, sort_keys=True).encode("utf-8")
+
 
 class CopilotClientError(Exception):
     """Raised when the Copilot Bridge returns an error."""
     pass
 
 
+@dataclass(frozen=True)
+class PreparedRequest:
+    """A serialized /chat request, built by CopilotClient.prepare() and sent with send()."""
+    path: str
+    body: bytes
+
+
 class CopilotClient(ICopilotClient):
     """HTTP-based client for the Copilot API Bridge VS Code extension."""
 
@@ -50,17 +93,53 @@ class CopilotClient(ICopilotClient):
         api_key: Optional[str] = None,
         default_model: Optional[str] = None,
         default_vendor: Optional[str] = None,
+        pool_size: int = 8,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+        metadata_ttl: float = 0.0,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.default_model = default_model
         self.default_vendor = default_vendor
+        self.pool_size = pool_size
+        # Seconds to reuse status()/list_models() results; 0 always asks the server
+        self.metadata_ttl = metadata_ttl
+
+        self._hdrs = {"Content-Type": "application/json"}
+        if api_key:
+            self._hdrs["Authorization"] = f"Bearer {api_key}"
+
+        url = urllib.parse.urlsplit(self.base_url)
+        self._connection_class = (
+            http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = url.hostname
+        self._port = url.port
+
+        # Request targets of the fixed endpoints, resolved once
+        self._path_status = f"{url.path}/status"
+        self._path_models = f"{url.path}/models"
+        self._path_chat = f"{url.path}/chat"
+        self._path_chat_stream = f"{url.path}/chat/stream"
+
+        # Idle keep-alive connections, reused across requests
+        self._pool: list[http.client.HTTPConnection] = []
+        self._pool_lock = threading.Lock()
+
+        # Opt-in LRU of /chat replies keyed by request payload; cache_size <= 0 disables it
+        # and cache_ttl=None never expires
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     # ── Public API ────────────────────────────────────────────────────────
 
+    @_ttl_cached
     def status(self) -> StatusResponse:
         """Get server status."""
-        data = self._get("/status")
+        data = self._get(self._path_status)
         return StatusResponse(
             status=data.get("status", ""),
             port=data.get("port", 0),
@@ -69,18 +148,21 @@ class CopilotClient(ICopilotClient):
             version=data.get("version", ""),
         )
 
+    @_ttl_cached
     def list_models(self) -> list[ModelInfo]:
         """List available Copilot models."""
-        data = self._get("/models")
-        return [
-            ModelInfo(
+        return list(self.iter_models())
+
+    def iter_models(self) -> Iterator[ModelInfo]:
+        """Iterate over available models, building each one only as it is consumed."""
+        data = self._get(self._path_models)
+        for m in data.get("models", []):
+            yield ModelInfo(
                 id=m.get("id", ""), name=m.get("name", ""),
                 vendor=m.get("vendor", ""), family=m.get("family", ""),
                 version=m.get("version", ""),
                 max_input_tokens=m.get("maxInputTokens", 0),
             )
-            for m in data.get("models", [])
-        ]
 
     def chat(
         self,
@@ -103,7 +185,7 @@ class CopilotClient(ICopilotClient):
             The assistant's response text.
         """
         payload = self._build_payload(messages, model, vendor, system_prompt)
-        data = self._post("/chat", payload)
+        data = self._chat(payload)
         return data.get("content", "")
 
     def chat_stream(
@@ -127,7 +209,7 @@ class CopilotClient(ICopilotClient):
             Response text fragments.
         """
         payload = self._build_payload(messages, model, vendor, system_prompt)
-        yield from self._post_stream("/chat/stream", payload)
+        yield from self._post_stream(self._path_chat_stream, payload)
 
     def chat_full(
         self,
@@ -139,12 +221,7 @@ class CopilotClient(ICopilotClient):
     ) -> ChatResponse:
         """Send a chat request and return the structured response."""
         payload = self._build_payload(messages, model, vendor, system_prompt)
-        data = self._post("/chat", payload)
-        return ChatResponse(
-            id=data.get("id", 0),
-            model=data.get("model", ""),
-            content=data.get("content", ""),
-        )
+        return self._chat_response(self._chat(payload))
 
     def chat_json(
         self,
@@ -158,23 +235,63 @@ class CopilotClient(ICopilotClient):
         Send a chat request and parse the response as JSON.
         Tries to extract JSON even if the response contains markdown fences.
         """
-        import re
-
         text = self.chat(messages, model=model, vendor=vendor, system_prompt=system_prompt)
-        # Try direct parse first
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            pass
+        # Parse directly when the reply is bare JSON; prose skips straight to extraction
+        stripped = text.strip()
+        if stripped[:1] in ("{", "[") and stripped[-1:] in ("}", "]"):
+            try:
+                return _loads(stripped)
+            except json.JSONDecodeError:
+                pass
         # Try extracting from code fences or raw braces
-        match = re.search(r"```(?:json)?\s*([\s\S]*?)```", text)
+        match = _JSON_FENCE_RE.search(text) if "```" in text else None
         if match:
             return json.loads(match.group(1).strip())
-        match = re.search(r"\{[\s\S]*\}", text)
-        if match:
-            return json.loads(match.group(0))
+        span = _extract_json_span(text)
+        if span:
+            return json.loads(span)
         raise CopilotClientError(f"Could not parse JSON from response:\n{text[:500]}")
 
+    def prepare(
+        self,
+        messages: Union[str, list[dict]],
+        *,
+        model: Optional[str] = None,
+        vendor: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> PreparedRequest:
+        """
+        Build and serialize a chat request once, for repeated send() calls.
+
+        Useful for retries and benchmarks: the payload is not rebuilt or
+        re-encoded on each send.
+        """
+        payload = self._build_payload(messages, model, vendor, system_prompt)
+        return PreparedRequest(self._path_chat, _dumps(payload))
+
+    def send(self, prepared: PreparedRequest) -> ChatResponse:
+        """Send a request built by prepare() and return the structured response."""
+        data = _loads(self._request("POST", prepared.path, prepared.body, timeout=300))
+        return self._chat_response(data)
+
+    def clear_cache(self) -> None:
+        """Drop all cached chat replies."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Close the pooled keep-alive connections; the client stays usable."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        for conn in pool:
+            conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     # ── Internals ─────────────────────────────────────────────────────────
 
     def _build_payload(
@@ -186,10 +303,12 @@ class CopilotClient(ICopilotClient):
     ) -> dict:
         if isinstance(messages, str):
             messages = [{"role": "user", "content": messages}]
+        elif all(isinstance(m, dict) for m in messages):
+            pass  # already plain dicts — send as-is, without rebuilding the list
         else:
             # Convert ChatMessage dataclass objects to dicts if needed
             messages = [
-                {"role": m.role, "content": m.content} if hasattr(m, "role") and not isinstance(m, dict) else m
+                m if isinstance(m, dict) else {"role": m.role, "content": m.content}
                 for m in messages
             ]
 
@@ -204,82 +323,137 @@ class CopilotClient(ICopilotClient):
             payload["systemPrompt"] = system_prompt
         return payload
 
+    def _chat(self, payload: dict) -> dict:
+        if self.cache_size <= 0:
+            return self._post(self._path_chat, payload)
+
+        key = hashlib.blake2b(_dumps_sorted(payload), digest_size=16).digest()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and (self.cache_ttl is None or time.monotonic() - entry[0] < self.cache_ttl):
+                self._cache.move_to_end(key)
+                return entry[1]
+
+        data = self._post(self._path_chat, payload)
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), data)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return data
+
+    @staticmethod
+    def _chat_response(data: dict) -> ChatResponse:
+        return ChatResponse(
+            id=data.get("id", 0),
+            model=data.get("model", ""),
+            content=data.get("content", ""),
+        )
+
     def _headers(self) -> dict:
-        h = {"Content-Type": "application/json"}
-        if self.api_key:
-            h["Authorization"] = f"Bearer {self.api_key}"
-        return h
+        # Kept for subclasses; requests use the prebuilt self._hdrs directly
+        return dict(self._hdrs)
 
     def _get(self, path: str) -> dict:
-        url = f"{self.base_url}{path}"
-        req = urllib.request.Request(url, headers=self._headers(), method="GET")
-        try:
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                return json.loads(resp.read().decode("utf-8"))
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace")
-            raise CopilotClientError(f"HTTP {e.code}: {body}") from e
-        except urllib.error.URLError as e:
-            raise CopilotClientError(
-                f"Cannot connect to Copilot Bridge at {self.base_url}. "
-                f"Is VS Code running with the extension? Error: {e.reason}"
-            ) from e
+        return _loads(self._request("GET", path, timeout=30))
 
     def _post(self, path: str, payload: dict) -> dict:
-        url = f"{self.base_url}{path}"
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(url, data=data, headers=self._headers(), method="POST")
-        try:
-            with urllib.request.urlopen(req, timeout=300) as resp:
-                return json.loads(resp.read().decode("utf-8"))
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace")
-            raise CopilotClientError(f"HTTP {e.code}: {body}") from e
-        except urllib.error.URLError as e:
-            raise CopilotClientError(
-                f"Cannot connect to Copilot Bridge at {self.base_url}. "
-                f"Is VS Code running with the extension? Error: {e.reason}"
-            ) from e
+        return _loads(self._request("POST", path, _dumps(payload), timeout=300))
 
     def _post_stream(self, path: str, payload: dict) -> Generator[str, None, None]:
-        url = f"{self.base_url}{path}"
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(url, data=data, headers=self._headers(), method="POST")
+        conn, resp = self._send("POST", path, _dumps(payload), timeout=300)
         try:
-            resp = urllib.request.urlopen(req, timeout=300)
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace")
-            raise CopilotClientError(f"HTTP {e.code}: {body}") from e
-        except urllib.error.URLError as e:
-            raise CopilotClientError(
-                f"Cannot connect to Copilot Bridge at {self.base_url}. Error: {e.reason}"
-            ) from e
+            if not 200 <= resp.status < 300:
+                body = resp.read().decode("utf-8", errors="replace")
+                raise CopilotClientError(f"HTTP {resp.status}: {body}")
+
+            # SSE events are runs of lines terminated by a blank line
+            event: list[bytes] = []
+            for raw in resp:
+                if raw not in (b"\n", b"\r\n"):
+                    event.append(raw)
+                    continue
+                for line in event:
+                    if line.startswith(b"data: "):
+                        # The trailing newline is JSON whitespace, so the slice parses as-is
+                        event_data = _loads(line[6:])
+                        if event_data.get("done"):
+                            # Drain the end of the body so the connection can be reused
+                            resp.read()
+                            return
+                        if "error" in event_data:
+                            raise CopilotClientError(event_data["error"])
+                        if "content" in event_data:
+                            yield event_data["content"]
+                event.clear()
+        except (OSError, http.client.HTTPException) as e:
+            raise self._connection_lost(e) from e
+        finally:
+            self._release(conn, resp)
+
+    # ── Connection pool ───────────────────────────────────────────────────
 
+    def _request(self, method: str, path: str, body: Optional[bytes] = None, *, timeout: float) -> bytes:
+        """Send a request on a pooled connection and return the response body."""
+        conn, resp = self._send(method, path, body, timeout=timeout)
         try:
-            buffer = ""
-            while True:
-                chunk = resp.read(1024)
-                if not chunk:
-                    break
-                buffer += chunk.decode("utf-8")
-                while "\n\n" in buffer:
-                    event, buffer = buffer.split("\n\n", 1)
-                    for line in event.split("\n"):
-                        if line.startswith("data: "):
-                            event_data = json.loads(line[6:])
-                            if event_data.get("done"):
-                                return
-                            if "error" in event_data:
-                                raise CopilotClientError(event_data["error"])
-                            if "content" in event_data:
-                                yield event_data["content"]
-        finally:
-            resp.close()
+            data = resp.read()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise self._connection_lost(e) from e
+        self._release(conn, resp)
+        if not 200 <= resp.status < 300:
+            raise CopilotClientError(f"HTTP {resp.status}: {data.decode('utf-8', errors='replace')}")
+        return data
+
+    def _send(
+        self, method: str, path: str, body: Optional[bytes], *, timeout: float,
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        while True:
+            conn, reused = self._acquire(timeout)
+            try:
+                conn.request(method, path, body=body, headers=self._hdrs)
+                return conn, conn.getresponse()
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                if reused and isinstance(e, (ConnectionResetError, BrokenPipeError)):
+                    # The server dropped an idle keep-alive socket; retry on another one
+                    continue
+                raise CopilotClientError(
+                    f"Cannot connect to Copilot Bridge at {self.base_url}. "
+                    f"Is VS Code running with the extension? Error: {e}"
+                ) from e
+
+    def _connection_lost(self, error: Exception) -> CopilotClientError:
+        return CopilotClientError(f"Connection to Copilot Bridge at {self.base_url} lost: {error}")
+
+    def _acquire(self, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._pool_lock:
+            conn = self._pool.pop() if self._pool else None
+        if conn is None:
+            return self._connection_class(self._host, self._port, timeout=timeout), False
+        conn.timeout = timeout
+        if conn.sock is None:
+            return conn, False
+        conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _release(self, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse) -> None:
+        # Only fully-read responses leave the connection in a reusable state
+        if not resp.isclosed() or resp.will_close:
+            conn.close()
+            return
+        with self._pool_lock:
+            if len(self._pool) < self.pool_size:
+                self._pool.append(conn)
+                return
+        conn.close()
 
 
 # ── Convenience function ──────────────────────────────────────────────────────
 
-_default_client: Optional[CopilotClient] = None
+# One client per endpoint, so each keeps its own warm connection pool
+_clients: dict[str, CopilotClient] = {}
 
 
 def ask_copilot(
@@ -295,10 +469,10 @@ def ask_copilot(
     >>> from copilot_client import ask_copilot
     >>> answer = ask_copilot("What is a monad?")
     """
-    global _default_client
-    if _default_client is None or _default_client.base_url != base_url:
-        _default_client = CopilotClient(base_url=base_url)
-    return _default_client.chat(prompt, model=model, system_prompt=system_prompt)
+    client = _clients.get(base_url)
+    if client is None:
+        client = _clients.setdefault(base_url, CopilotClient(base_url=base_url))
+    return client.chat(prompt, model=model, system_prompt=system_prompt)
 
 
 if __name__ == "__main__":
@@ -16,21 +16,91 @@ Usage:
 
     for chunk in client.chat_stream("Write a poem"):
         print(chunk, end="", flush=True)
+
+    # asyncio: concurrent chats multiplexed over one HTTP/2 connection
+    async with AsyncCopilotGrpcClient() as client:
+        answers = await asyncio.gather(*(client.chat(p) for p in prompts))
 """
 
 from __future__ import annotations
 
+import threading
+
 import grpc
-from typing import Generator, Optional, Union
+from typing import Any, AsyncGenerator, Generator, Iterator, Optional, Sequence, Union
 
 from copilot_interface import (
     ICopilotClient, ChatMessage, ChatResponse, ModelInfo, StatusResponse,
+    _ttl_cached,
 )
 
 # Import generated protobuf stubs
 import copilot_bridge_pb2 as pb2
 import copilot_bridge_pb2_grpc as pb2_grpc
 
+# Channel settings tuned for a loopback server (channels are also created uncompressed)
+_CHANNEL_OPTIONS = [
+    ("grpc.max_receive_message_length", -1),
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.use_local_subchannel_pool", 1),
+    # Coalesce socket reads so a burst of small stream chunks arrives in fewer reads
+    ("grpc.experimental.tcp_read_chunk_size", 65536),
+]
+
+
+def _channel_options(options: Sequence[tuple[str, Any]]) -> tuple[tuple[str, Any], ...]:
+    """Loopback defaults overlaid with caller-supplied channel options."""
+    merged = dict(_CHANNEL_OPTIONS)
+    merged.update(options)
+    return tuple(merged.items())
+
+
+class _ChannelCache:
+    """Process-wide channels and their stubs, shared by every client.
+
+    Entries are keyed by (address, credentials, options) and reference-counted;
+    a channel is closed once its last client releases it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, list] = {}  # key -> [channel, stub, refcount]
+
+    def acquire(
+        self,
+        address: str,
+        credentials: Optional[grpc.ChannelCredentials] = None,
+        options: Sequence[tuple[str, Any]] = (),
+    ) -> tuple[tuple, grpc.Channel, pb2_grpc.CopilotBridgeServiceStub]:
+        opts = _channel_options(options)
+        key = (address, credentials, opts)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if credentials is None:
+                    channel = grpc.insecure_channel(
+                        address, options=opts, compression=grpc.Compression.NoCompression,
+                    )
+                else:
+                    channel = grpc.secure_channel(
+                        address, credentials, options=opts, compression=grpc.Compression.NoCompression,
+                    )
+                stub = pb2_grpc.CopilotBridgeServiceStub(channel)
+                entry = self._entries[key] = [channel, stub, 0]
+            entry[2] += 1
+            return key, entry[0], entry[1]
+
+    def release(self, key: tuple) -> None:
+        with self._lock:
+            entry = self._entries[key]
+            entry[2] -= 1
+            if entry[2] == 0:
+                del self._entries[key]
+                entry[0].close()
+
+
+_channel_cache = _ChannelCache()
+
 
 class CopilotGrpcClient(ICopilotClient):
     """gRPC-based client for the Copilot Bridge."""
@@ -40,15 +110,22 @@ class CopilotGrpcClient(ICopilotClient):
         address: str = "127.0.0.1:3742",
         default_model: Optional[str] = None,
         default_vendor: Optional[str] = None,
+        credentials: Optional[grpc.ChannelCredentials] = None,
+        options: Sequence[tuple[str, Any]] = (),
+        metadata_ttl: float = 0.0,
     ):
         self.address = address
         self.default_model = default_model or ""
         self.default_vendor = default_vendor or ""
-        self._channel = grpc.insecure_channel(address)
-        self._stub = pb2_grpc.CopilotBridgeServiceStub(self._channel)
+        # Seconds to reuse status()/list_models() results; 0 always asks the server
+        self.metadata_ttl = metadata_ttl
+        self._channel_key, self._channel, self._stub = _channel_cache.acquire(address, credentials, options)
 
     def close(self):
-        self._channel.close()
+        # The channel is shared; it is closed once its last client lets go
+        if self._channel is not None:
+            self._channel = None
+            _channel_cache.release(self._channel_key)
 
     def __enter__(self):
         return self
@@ -58,6 +135,7 @@ class CopilotGrpcClient(ICopilotClient):
 
     # ── ICopilotClient implementation ─────────────────────────────────────
 
+    @_ttl_cached
     def status(self) -> StatusResponse:
         reply = self._stub.GetStatus(pb2.StatusRequest())
         return StatusResponse(
@@ -68,16 +146,18 @@ class CopilotGrpcClient(ICopilotClient):
             version=reply.version,
         )
 
+    @_ttl_cached
     def list_models(self) -> list[ModelInfo]:
+        return list(self.iter_models())
+
+    def iter_models(self) -> Iterator[ModelInfo]:
         reply = self._stub.ListModels(pb2.ListModelsRequest())
-        return [
-            ModelInfo(
+        for m in reply.models:
+            yield ModelInfo(
                 id=m.id, name=m.name, vendor=m.vendor,
                 family=m.family, version=m.version,
                 max_input_tokens=m.max_input_tokens,
             )
-            for m in reply.models
-        ]
 
     def chat(
         self,
@@ -140,3 +220,108 @@ class CopilotGrpcClient(ICopilotClient):
             vendor=vendor or self.default_vendor,
             system_prompt=system_prompt or "",
         )
+
+
+class AsyncCopilotGrpcClient:
+    """asyncio gRPC client for the Copilot Bridge.
+
+    Mirrors CopilotGrpcClient with awaitable methods. Concurrent calls share a
+    single grpc.aio channel, so they run as parallel HTTP/2 streams on one
+    connection. Create it from inside the event loop that will use it.
+    """
+
+    def __init__(
+        self,
+        address: str = "127.0.0.1:3742",
+        default_model: Optional[str] = None,
+        default_vendor: Optional[str] = None,
+        credentials: Optional[grpc.ChannelCredentials] = None,
+        options: Sequence[tuple[str, Any]] = (),
+    ):
+        self.address = address
+        self.default_model = default_model or ""
+        self.default_vendor = default_vendor or ""
+        opts = _channel_options(options)
+        if credentials is None:
+            self._channel = grpc.aio.insecure_channel(
+                address, options=opts, compression=grpc.Compression.NoCompression,
+            )
+        else:
+            self._channel = grpc.aio.secure_channel(
+                address, credentials, options=opts, compression=grpc.Compression.NoCompression,
+            )
+        self._stub = pb2_grpc.CopilotBridgeServiceStub(self._channel)
+
+    async def close(self):
+        await self._channel.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def status(self) -> StatusResponse:
+        reply = await self._stub.GetStatus(pb2.StatusRequest())
+        return StatusResponse(
+            status=reply.status,
+            port=reply.port,
+            default_model=reply.default_model,
+            requests_served=reply.requests_served,
+            version=reply.version,
+        )
+
+    async def list_models(self) -> list[ModelInfo]:
+        reply = await self._stub.ListModels(pb2.ListModelsRequest())
+        return [
+            ModelInfo(
+                id=m.id, name=m.name, vendor=m.vendor,
+                family=m.family, version=m.version,
+                max_input_tokens=m.max_input_tokens,
+            )
+            for m in reply.models
+        ]
+
+    async def chat(
+        self,
+        messages: Union[str, list[ChatMessage]],
+        *,
+        model: Optional[str] = None,
+        vendor: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> str:
+        req = self._build_request(messages, model, vendor, system_prompt)
+        reply = await self._stub.Chat(req)
+        return reply.content
+
+    async def chat_full(
+        self,
+        messages: Union[str, list[ChatMessage]],
+        *,
+        model: Optional[str] = None,
+        vendor: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> ChatResponse:
+        req = self._build_request(messages, model, vendor, system_prompt)
+        reply = await self._stub.Chat(req)
+        return ChatResponse(id=reply.id, model=reply.model, content=reply.content)
+
+    async def chat_stream(
+        self,
+        messages: Union[str, list[ChatMessage]],
+        *,
+        model: Optional[str] = None,
+        vendor: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> AsyncGenerator[str, None]:
+        req = self._build_request(messages, model, vendor, system_prompt)
+        async for chunk in self._stub.ChatStream(req):
+            if chunk.error:
+                raise RuntimeError(f"gRPC stream error: {chunk.error}")
+            if chunk.done:
+                return
+            if chunk.content:
+                yield chunk.content
+
+    # Requests are built exactly as in the sync client
+    _build_request = CopilotGrpcClient._build_request
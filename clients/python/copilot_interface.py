@@ -13,27 +13,99 @@ Usage:
 
 from __future__ import annotations
 
+import functools
+import json
+import re
+import sys
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Generator, Iterator, Optional, Union
 
 
+# Patterns used by chat_json to pull JSON out of a free-form reply
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+_JSON_TOKEN_RE = re.compile(r'[{}"\\]')
+
+
+def _extract_json_span(text: str) -> Optional[str]:
+    """Return the first balanced ``{...}`` span in text, or None.
+
+    Single pass over the structural characters only; braces inside string
+    literals are ignored.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    escaped = -1
+    for match in _JSON_TOKEN_RE.finditer(text, start):
+        i = match.start()
+        if i == escaped:
+            continue
+        c = text[i]
+        if in_string:
+            if c == "\\":
+                escaped = i + 1
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def _ttl_cached(method):
+    """Cache a no-argument method's result on the instance for ``self.metadata_ttl`` seconds.
+
+    A ttl of 0 disables caching. List results are stored as a tuple and each
+    caller gets a fresh list, so sorting or filtering one in place is safe.
+    """
+    attr = f"_ttl_cache_{method.__name__}"
+
+    @functools.wraps(method)
+    def wrapper(self):
+        ttl = self.metadata_ttl
+        if ttl <= 0:
+            return method(self)
+        now = time.monotonic()
+        cached = getattr(self, attr, None)
+        if cached is not None and now < cached[0]:
+            value = cached[1]
+            return list(value) if isinstance(value, tuple) else value
+        value = method(self)
+        setattr(self, attr, (now + ttl, tuple(value) if isinstance(value, list) else value))
+        return value
+
+    return wrapper
+
+
 # ── Data Models ──────────────────────────────────────────────────────────────
 
-@dataclass
+# Slotted instances (Python 3.10+) are smaller and faster to build and read
+_model = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+
+@_model
 class ChatMessage:
     role: str       # "user" | "assistant"
     content: str
 
 
-@dataclass
+@_model
 class ChatOptions:
     model: Optional[str] = None
     vendor: Optional[str] = None
     system_prompt: Optional[str] = None
 
 
-@dataclass
+@_model
 class StatusResponse:
     status: str = ""
     port: int = 0
@@ -42,7 +114,7 @@ class StatusResponse:
     version: str = ""
 
 
-@dataclass
+@_model
 class ModelInfo:
     id: str = ""
     name: str = ""
@@ -52,7 +124,7 @@ class ModelInfo:
     max_input_tokens: int = 0
 
 
-@dataclass
+@_model
 class ChatResponse:
     id: int = 0
     model: str = ""
@@ -75,6 +147,10 @@ class ICopilotClient(ABC):
         """List available Copilot models."""
         ...
 
+    def iter_models(self) -> Iterator[ModelInfo]:
+        """Iterate over available models, building each one only as it is consumed."""
+        return iter(self.list_models())
+
     @abstractmethod
     def chat(
         self,
@@ -120,18 +196,17 @@ class ICopilotClient(ABC):
         system_prompt: Optional[str] = None,
     ) -> dict:
         """Send a chat request and parse the response as JSON."""
-        import json
-        import re
-
         text = self.chat(messages, model=model, vendor=vendor, system_prompt=system_prompt)
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            pass
-        match = re.search(r"```(?:json)?\s*([\s\S]*?)```", text)
+        stripped = text.strip()
+        if stripped[:1] in ("{", "[") and stripped[-1:] in ("}", "]"):
+            try:
+                return json.loads(stripped)
+            except json.JSONDecodeError:
+                pass
+        match = _JSON_FENCE_RE.search(text) if "```" in text else None
         if match:
             return json.loads(match.group(1).strip())
-        match = re.search(r"\{[\s\S]*\}", text)
-        if match:
-            return json.loads(match.group(0))
+        span = _extract_json_span(text)
+        if span:
+            return json.loads(span)
         raise ValueError(f"Could not parse JSON from response:\n{text[:500]}")
@@ -12,31 +12,75 @@ Usage:
     python test.py --grpc-only        # gRPC tests only
     python test.py --base-url http://127.0.0.1:3741
     python test.py --grpc-address 127.0.0.1:3742
+    python test.py --full             # Also run the checks folded into chat_batch individually
+    python test.py --maxfail 3        # Stop a transport after 3 consecutive failures
+    python test.py --stream           # Print each result as it completes
+
+The same cases also run under pytest, in parallel with pytest-xdist
+(pip install pytest pytest-xdist). Configure them through the environment:
+    pytest -n auto test.py
+    COPILOT_BASE_URL=... COPILOT_GRPC_ADDRESS=... COPILOT_MODEL=gpt-4o pytest -n auto test.py
+    pytest -n auto test.py -k http   # one transport only
+    COPILOT_FULL=1 pytest -n auto test.py   # like --full
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
+import http.client
+import importlib.util
+import json
 import sys
+import threading
 import time
-import traceback
-from typing import Optional
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 
 # Add clients/python to path
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "clients", "python"))
 
-from copilot_interface import ICopilotClient, StatusResponse, ModelInfo, ChatResponse
+from copilot_interface import ICopilotClient, StatusResponse, ModelInfo, ChatResponse, ChatMessage
+from copilot_client import CopilotClient
+
+# copilot_grpc_client (and grpcio with it) stays a lazy import; this only checks it is installed
+_HAS_GRPC = importlib.util.find_spec("grpc") is not None
+
+try:
+    import pytest
+except ImportError:  # only needed when collected by pytest; the runner below is self-contained
+    pytest = None
 
 
 # ── Test Framework ───────────────────────────────────────────────────────────
 
+# Monotonic, high-resolution clock for test durations
+_now = time.perf_counter
+
+
 class TestResult:
-    def __init__(self, name: str, passed: bool, message: str = "", duration: float = 0.0):
+    __test__ = False  # not a pytest test class
+    __slots__ = ("name", "passed", "_message", "duration", "error")
+
+    def __init__(
+        self, name: str, passed: bool, message: str = "", duration: float = 0.0,
+        error: Optional[Exception] = None,
+    ):
         self.name = name
         self.passed = passed
-        self.message = message
+        self._message = message
         self.duration = duration
+        self.error = error
+
+    @property
+    def message(self) -> str:
+        # A captured exception is only formatted when the result is reported
+        if self.error is not None and not self._message:
+            return f"{type(self.error).__name__}: {self.error}"
+        return self._message
 
     def __str__(self):
         icon = "PASS" if self.passed else "FAIL"
@@ -47,18 +91,51 @@ class TestResult:
 
 def run_test(name: str, func, *args, **kwargs) -> TestResult:
     """Run a single test function and capture pass/fail."""
-    start = time.time()
+    start = _now()
     try:
         result_msg = func(*args, **kwargs)
-        duration = time.time() - start
+        duration = _now() - start
         return TestResult(name, True, result_msg or "", duration)
     except Exception as e:
-        duration = time.time() - start
-        return TestResult(name, False, f"{type(e).__name__}: {e}", duration)
+        duration = _now() - start
+        return TestResult(name, False, duration=duration, error=e)
+
+
+class _Report:
+    """Collects a block of report lines and writes it with a single call.
+
+    With live=True each line is printed as soon as it is produced instead.
+    """
+    __slots__ = ("live", "lines")
+
+    def __init__(self, live: bool = False):
+        self.live = live
+        self.lines: list[str] = []
+
+    def line(self, text: object = "") -> None:
+        if self.live:
+            print(text, flush=True)
+        else:
+            self.lines.append(str(text))
+
+    def flush(self) -> None:
+        if self.lines:
+            sys.stdout.write("\n".join(self.lines) + "\n")
+            sys.stdout.flush()
+            self.lines.clear()
+
+
+def _maxfail_reached(results: list[TestResult], maxfail: int) -> bool:
+    """True once the last `maxfail` results all failed (maxfail=0 never trips)."""
+    return 0 < maxfail <= len(results) and not any(r.passed for r in results[-maxfail:])
 
 
 # ── Test Cases ───────────────────────────────────────────────────────────────
 
+# Stop consuming a chat stream after this many characters
+MAX_STREAM_CHARS = 64 * 1024
+
+
 def test_status(client: ICopilotClient) -> str:
     """Test GET /status endpoint."""
     status = client.status()
@@ -81,6 +158,16 @@ def test_list_models(client: ICopilotClient) -> str:
     return f"{len(models)} models: {', '.join(families)}"
 
 
+def test_iter_models(client: ICopilotClient) -> str:
+    """Test lazy model iteration against list_models()."""
+    first = next(iter(client.iter_models()), None)
+    assert isinstance(first, ModelInfo), f"Expected ModelInfo, got {type(first)}"
+    models = list(client.iter_models())
+    expected = client.list_models()
+    assert models == expected, f"iter_models() gave {len(models)} models, list_models() {len(expected)}"
+    return f"{len(models)} models, first={first.family}"
+
+
 def test_chat_simple(client: ICopilotClient, model: Optional[str] = None) -> str:
     """Test simple chat with a string prompt."""
     response = client.chat("Reply with exactly: HELLO_TEST_OK", model=model)
@@ -111,8 +198,6 @@ def test_chat_with_system_prompt(client: ICopilotClient, model: Optional[str] =
 
 def test_chat_conversation(client: ICopilotClient, model: Optional[str] = None) -> str:
     """Test multi-turn conversation."""
-    from copilot_interface import ChatMessage
-
     response = client.chat(
         [
             ChatMessage(role="user", content="My name is TestBot."),
@@ -135,17 +220,32 @@ def test_chat_full(client: ICopilotClient, model: Optional[str] = None) -> str:
     return f"id={resp.id}, model={resp.model}, content_len={len(resp.content)}"
 
 
+def test_chat_batch(client: ICopilotClient, model: Optional[str] = None) -> str:
+    """Test chat_full with one prompt covering the chat_simple/chat_with_model/chat_full checks."""
+    tokens = ("HELLO_TEST_OK", "MODEL_TEST_OK", "FULL_TEST_OK")
+    resp = client.chat_full("Respond with exactly three lines:\n" + "\n".join(tokens), model=model)
+    assert isinstance(resp, ChatResponse), f"Expected ChatResponse, got {type(resp)}"
+    assert resp.content, "Content should not be empty"
+    assert resp.model, "Model should not be empty"
+    missing = [t for t in tokens if t not in resp.content]
+    assert not missing, f"Missing {', '.join(missing)} in response: '{resp.content[:80]}'"
+    return f"id={resp.id}, model={resp.model}, content_len={len(resp.content)}"
+
+
 def test_chat_stream(client: ICopilotClient, model: Optional[str] = None) -> str:
     """Test streaming chat response."""
-    chunks = []
+    chunk_count = 0
+    total_len = 0
     for chunk in client.chat_stream("Count from 1 to 5, one number per line", model=model):
         assert isinstance(chunk, str), f"Expected str chunk, got {type(chunk)}"
-        chunks.append(chunk)
+        chunk_count += 1
+        total_len += len(chunk)
+        if total_len > MAX_STREAM_CHARS:
+            break  # a runaway stream has proven the point; stop reading
 
-    full_text = "".join(chunks)
-    assert len(chunks) > 0, "Should receive at least one chunk"
-    assert len(full_text) > 0, "Combined text should not be empty"
-    return f"{len(chunks)} chunks, total {len(full_text)} chars"
+    assert chunk_count > 0, "Should receive at least one chunk"
+    assert total_len > 0, "Combined text should not be empty"
+    return f"{chunk_count} chunks, total {total_len} chars"
 
 
 def test_chat_json(client: ICopilotClient, model: Optional[str] = None) -> str:
@@ -173,52 +273,179 @@ def test_chat_empty_rejected(client: ICopilotClient) -> str:
 
 # ── HTTP-only tests ──────────────────────────────────────────────────────────
 
+# Keep-alive connections for the raw HTTP tests, one per server
+_raw_connections: dict[str, http.client.HTTPConnection] = {}
+
+
+def _raw_get(base_url: str, path: str) -> tuple[http.client.HTTPResponse, bytes]:
+    """GET a path over a persistent raw connection; returns the response and its body."""
+    url = urllib.parse.urlsplit(base_url)
+    conn = _raw_connections.get(base_url)
+    if conn is None:
+        conn_class = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        conn = _raw_connections[base_url] = conn_class(url.hostname, url.port, timeout=10)
+    try:
+        conn.request("GET", url.path + path)
+        resp = conn.getresponse()
+    except (ConnectionResetError, BrokenPipeError):
+        # The server dropped the idle socket; reconnect once
+        conn.close()
+        conn.request("GET", url.path + path)
+        resp = conn.getresponse()
+    return resp, resp.read()
+
+
 def test_http_raw_status(base_url: str) -> str:
     """Test raw HTTP GET /status."""
-    import urllib.request
-    import json
-
-    req = urllib.request.Request(f"{base_url}/status")
-    with urllib.request.urlopen(req, timeout=10) as resp:
-        assert resp.status == 200, f"Expected 200, got {resp.status}"
-        data = json.loads(resp.read().decode("utf-8"))
-        assert data["status"] == "running"
-        return f"raw HTTP OK, port={data.get('port')}"
+    resp, body = _raw_get(base_url, "/status")
+    assert resp.status == 200, f"Expected 200, got {resp.status}"
+    data = json.loads(body)
+    assert data["status"] == "running"
+    return f"raw HTTP OK, port={data.get('port')}"
 
 
 def test_http_not_found(base_url: str) -> str:
     """Test that unknown endpoints return 404."""
-    import urllib.request
-    import urllib.error
-
-    try:
-        req = urllib.request.Request(f"{base_url}/nonexistent")
-        urllib.request.urlopen(req, timeout=10)
-        raise AssertionError("Should have returned 404")
-    except urllib.error.HTTPError as e:
-        assert e.code == 404, f"Expected 404, got {e.code}"
-        return "correctly returned 404"
+    resp, _ = _raw_get(base_url, "/nonexistent")
+    assert resp.status == 404, f"Expected 404, got {resp.status}"
+    return "correctly returned 404"
 
 
 def test_http_cors_headers(base_url: str) -> str:
     """Test CORS headers are present."""
-    import urllib.request
-
-    req = urllib.request.Request(f"{base_url}/status")
-    with urllib.request.urlopen(req, timeout=10) as resp:
-        cors = resp.headers.get("Access-Control-Allow-Origin")
-        assert cors == "*", f"Expected CORS '*', got '{cors}'"
-        return f"CORS header: {cors}"
+    resp, _ = _raw_get(base_url, "/status")
+    cors = resp.getheader("Access-Control-Allow-Origin")
+    assert cors == "*", f"Expected CORS '*', got '{cors}'"
+    return f"CORS header: {cors}"
+
+
+def test_http_prepare_send(http_client: CopilotClient, model: Optional[str] = None) -> str:
+    """Test that one prepare() result can be sent repeatedly."""
+    prepared = http_client.prepare("Reply with: PREPARED_OK", model=model)
+    first = http_client.send(prepared)
+    second = http_client.send(prepared)
+    for resp in (first, second):
+        assert isinstance(resp, ChatResponse), f"Expected ChatResponse, got {type(resp)}"
+        assert resp.content, "Content should not be empty"
+    return f"sent twice, content_len={len(first.content)}/{len(second.content)}"
+
+
+def test_http_reply_cache(http_client: CopilotClient, model: Optional[str] = None) -> str:
+    """Test that repeated chats are served from the reply cache until clear_cache()."""
+    if pytest is not None and os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1") != "1":
+        pytest.skip("requests_served is also moved by chats on other xdist workers")
+    with CopilotClient(base_url=http_client.base_url, api_key=http_client.api_key, cache_size=4) as cached:
+        before = cached.status().requests_served
+        first = cached.chat("Reply with: CACHE_TEST_OK", model=model)
+        second = cached.chat("Reply with: CACHE_TEST_OK", model=model)
+        after = cached.status().requests_served
+        assert second == first, "Cached reply should match the first one"
+        assert after - before == 1, f"Expected 1 chat request for 2 identical calls, server counted {after - before}"
+
+        cached.clear_cache()
+        cached.chat("Reply with: CACHE_TEST_OK", model=model)
+        cleared = cached.status().requests_served
+        assert cleared - after == 1, (
+            f"Expected a new chat request after clear_cache(), server counted {cleared - after}"
+        )
+    return f"2 calls -> 1 request, clear_cache() -> 1 more (requests_served={cleared})"
+
+
+# ── gRPC-only tests ──────────────────────────────────────────────────────────
+
+def test_grpc_async_concurrent(grpc_address: str, model: Optional[str] = None) -> str:
+    """Test AsyncCopilotGrpcClient with two chats and a stream gathered on one channel."""
+    from copilot_grpc_client import AsyncCopilotGrpcClient
+
+    async def run() -> list[str]:
+        async with AsyncCopilotGrpcClient(address=grpc_address) as client:
+            async def stream() -> str:
+                prompt = "Count from 1 to 3, one number per line"
+                chunks = [chunk async for chunk in client.chat_stream(prompt, model=model)]
+                assert all(isinstance(c, str) for c in chunks), "Expected str chunks"
+                return "".join(chunks)
+
+            return await asyncio.gather(
+                client.chat("Reply with exactly: ASYNC_ONE_OK", model=model),
+                client.chat("Reply with exactly: ASYNC_TWO_OK", model=model),
+                stream(),
+            )
+
+    first, second, streamed = asyncio.run(run())
+    for response in (first, second):
+        assert isinstance(response, str), f"Expected str, got {type(response)}"
+        assert len(response) > 0, "Response should not be empty"
+    assert streamed, "Combined stream text should not be empty"
+    return f"2 chats ({len(first)}, {len(second)} chars) + stream ({len(streamed)} chars)"
+
+
+# ── pytest Fixtures ──────────────────────────────────────────────────────────
+
+if pytest is not None:
+    # The cases return a summary string for the script runner
+    if hasattr(pytest, "PytestReturnNotNoneWarning"):
+        pytestmark = pytest.mark.filterwarnings("ignore::pytest.PytestReturnNotNoneWarning")
+
+    @pytest.fixture(scope="session")
+    def base_url() -> str:
+        return os.environ.get("COPILOT_BASE_URL", "http://127.0.0.1:3741")
+
+    @pytest.fixture(scope="session")
+    def grpc_address() -> str:
+        """Address of a reachable gRPC server; skips when grpcio or the server is missing."""
+        if not _HAS_GRPC:
+            pytest.skip("grpcio is not installed")
+        # grpcio alone is not enough: the generated stubs and a matching protobuf must import too
+        try:
+            from copilot_grpc_client import CopilotGrpcClient
+        except ImportError as e:
+            pytest.skip(f"gRPC client not importable: {e}")
+        address = os.environ.get("COPILOT_GRPC_ADDRESS", "127.0.0.1:3742")
+        probe = CopilotGrpcClient(address=address)
+        try:
+            probe.status()
+        except Exception as e:
+            pytest.skip(f"gRPC server not reachable: {e}")
+        finally:
+            probe.close()
+        return address
+
+    @pytest.fixture(scope="session")
+    def http_client(base_url: str):
+        """The HTTP client, for tests of CopilotClient-only API."""
+        with CopilotClient(
+            base_url=base_url, api_key=os.environ.get("COPILOT_API_KEY"),
+            default_model=os.environ.get("COPILOT_MODEL") or None, metadata_ttl=5.0,
+        ) as http_client:
+            yield http_client
+
+    @pytest.fixture(scope="session", params=["http", "grpc"])
+    def client(request):
+        """One client per transport, shared by every test in a worker."""
+        model = os.environ.get("COPILOT_MODEL") or None
+        if request.param == "http":
+            yield request.getfixturevalue("http_client")
+            return
+
+        address = request.getfixturevalue("grpc_address")
+        from copilot_grpc_client import CopilotGrpcClient
+        with CopilotGrpcClient(address=address, default_model=model, metadata_ttl=5.0) as grpc_client:
+            yield grpc_client
 
 
 # ── Test Runner ──────────────────────────────────────────────────────────────
 
 def pick_model_interactive(client: ICopilotClient) -> str:
-    """List models and let the user pick one interactively."""
+    """List models and let the user pick one interactively.
+
+    Without a terminal on stdin (CI, piped runs) the first model is used.
+    """
     models = client.list_models()
     if not models:
         print("  No models available!")
         sys.exit(1)
+    if not sys.stdin.isatty():
+        return models[0].family
 
     print(f"\n  Available models ({len(models)}):")
     print(f"  {'─' * 50}")
@@ -240,53 +467,157 @@ def pick_model_interactive(client: ICopilotClient) -> str:
             print(f"  Invalid input. Enter 1-{len(models)}.")
 
 
-def run_interface_tests(client: ICopilotClient, transport_name: str, model: Optional[str] = None) -> list[TestResult]:
-    """Run all ICopilotClient interface tests against a given client."""
+# Interface test tables: (name, test function, whether it takes the model).
+# Cheap checks run first, one at a time, so a dead server fails fast.
+_SMOKE_TESTS: tuple[tuple[str, Callable, bool], ...] = (
+    ("status", test_status, False),
+    ("chat_empty_rejected", test_chat_empty_rejected, False),
+)
+# The rest are independent round-trips and run concurrently.
+_INTERFACE_TESTS: tuple[tuple[str, Callable, bool], ...] = (
+    ("list_models", test_list_models, False),
+    ("iter_models", test_iter_models, False),
+    ("chat_batch", test_chat_batch, True),
+    ("chat_with_system_prompt", test_chat_with_system_prompt, True),
+    ("chat_conversation", test_chat_conversation, True),
+    ("chat_stream", test_chat_stream, True),
+    ("chat_json", test_chat_json, True),
+)
+# Covered by chat_batch; only run with --full.
+_FULL_ONLY_TESTS: tuple[tuple[str, Callable, bool], ...] = (
+    ("chat_simple", test_chat_simple, True),
+    ("chat_with_model", test_chat_with_model, True),
+    ("chat_full", test_chat_full, True),
+)
+
+if pytest is not None:
+    # Opt-in under pytest too: COPILOT_FULL=1 is the counterpart of --full
+    _full_only = pytest.mark.skipif(
+        not os.environ.get("COPILOT_FULL"), reason="covered by chat_batch; set COPILOT_FULL=1 to run",
+    )
+    for _name, _func, _ in _FULL_ONLY_TESTS:
+        _full_only(_func)
+
+# With --maxfail, interface tests run at most this many at a time, so a server
+# that keeps failing leaves queued tests to skip instead of paying for each one
+_MAXFAIL_WORKERS = 4
+
+
+def run_interface_tests(
+    client: ICopilotClient, transport_name: str, model: Optional[str] = None, full: bool = False,
+    maxfail: int = 0, stream: bool = False,
+) -> list[TestResult]:
+    """Run all ICopilotClient interface tests against a given client.
+
+    chat_batch covers chat_simple, chat_with_model and chat_full in a single
+    model call; pass full=True to also run those three individually. With
+    maxfail set, the concurrent tests run on a pool of _MAXFAIL_WORKERS and,
+    once `maxfail` of them fail in a row, those still queued are skipped.
+    The block is written once at the end unless stream=True.
+    """
     results = []
-    tests = [
-        ("status", test_status, client),
-        ("list_models", test_list_models, client),
-        ("chat_simple", test_chat_simple, client, model),
-        ("chat_with_model", test_chat_with_model, client, model),
-        ("chat_with_system_prompt", test_chat_with_system_prompt, client, model),
-        ("chat_conversation", test_chat_conversation, client, model),
-        ("chat_full", test_chat_full, client, model),
-        ("chat_stream", test_chat_stream, client, model),
-        ("chat_json", test_chat_json, client, model),
-        ("chat_empty_rejected", test_chat_empty_rejected, client),
-    ]
+    tests = _INTERFACE_TESTS + _FULL_ONLY_TESTS if full else _INTERFACE_TESTS
+    report = _Report(stream)
 
-    print(f"\n{'=' * 60}")
-    print(f"  {transport_name} Transport Tests (model: {model or 'default'})")
-    print(f"{'=' * 60}")
+    report.line(f"\n{'=' * 60}")
+    report.line(f"  {transport_name} Transport Tests (model: {model or 'default'})")
+    report.line(f"{'=' * 60}")
 
-    for name, func, *args in tests:
+    for name, func, needs_model in _SMOKE_TESTS:
+        args = (client, model) if needs_model else (client,)
         result = run_test(f"{transport_name}::{name}", func, *args)
         results.append(result)
-        print(result)
-
+        report.line(result)
+
+    if not all(r.passed for r in results):
+        for name, _, _ in tests:
+            result = TestResult(f"{transport_name}::{name}", False, "not run (smoke checks failed)")
+            results.append(result)
+            report.line(result)
+        report.flush()
+        return results
+
+    # Failures are counted as tests finish, so a worker sees the limit before taking the next test
+    tripped = threading.Event()
+    streak_lock = threading.Lock()
+    streak = 0
+
+    def run_unless_tripped(name: str, func: Callable, *args) -> TestResult:
+        nonlocal streak
+        if tripped.is_set():
+            return TestResult(name, False, "skipped after maxfail")
+        result = run_test(name, func, *args)
+        with streak_lock:
+            streak = 0 if result.passed else streak + 1
+            if 0 < maxfail <= streak:
+                tripped.set()
+        return result
+
+    workers = min(_MAXFAIL_WORKERS, len(tests)) if maxfail else len(tests)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                run_unless_tripped, f"{transport_name}::{name}", func,
+                *((client, model) if needs_model else (client,)),
+            )
+            for name, func, needs_model in tests
+        ]
+        # Report in the declared order, each as soon as it and those before it are done
+        for future in futures:
+            result = future.result()
+            results.append(result)
+            report.line(result)
+
+    report.flush()
     return results
 
 
-def run_http_specific_tests(base_url: str) -> list[TestResult]:
-    """Run HTTP-specific tests (raw requests, CORS, etc.)"""
+def _run_serial_section(
+    title: str, prefix: str, tests: list[tuple], maxfail: int = 0, stream: bool = False,
+) -> list[TestResult]:
+    """Run (name, func, *args) tests one at a time under a section header."""
     results = []
+    report = _Report(stream)
+
+    report.line(f"\n{'=' * 60}")
+    report.line(f"  {title}")
+    report.line(f"{'=' * 60}")
+
+    for name, func, *args in tests:
+        if _maxfail_reached(results, maxfail):
+            result = TestResult(f"{prefix}::{name}", False, "skipped after maxfail")
+        else:
+            result = run_test(f"{prefix}::{name}", func, *args)
+        results.append(result)
+        report.line(result)
+
+    report.flush()
+    return results
+
+
+def run_http_specific_tests(
+    client: CopilotClient, model: Optional[str] = None, maxfail: int = 0, stream: bool = False,
+) -> list[TestResult]:
+    """Run HTTP-specific tests (raw requests, CORS, prepare/send, etc.)"""
+    base_url = client.base_url
     tests = [
         ("http_raw_status", test_http_raw_status, base_url),
         ("http_not_found", test_http_not_found, base_url),
         ("http_cors_headers", test_http_cors_headers, base_url),
+        ("http_prepare_send", test_http_prepare_send, client, model),
+        ("http_reply_cache", test_http_reply_cache, client, model),
     ]
+    return _run_serial_section("HTTP-Specific Tests", "HTTP", tests, maxfail, stream)
 
-    print(f"\n{'=' * 60}")
-    print(f"  HTTP-Specific Tests")
-    print(f"{'=' * 60}")
-
-    for name, func, *args in tests:
-        result = run_test(f"HTTP::{name}", func, *args)
-        results.append(result)
-        print(result)
 
-    return results
+def run_grpc_specific_tests(
+    address: str, model: Optional[str] = None, maxfail: int = 0, stream: bool = False,
+) -> list[TestResult]:
+    """Run gRPC-specific tests (the asyncio client)."""
+    tests = [
+        ("grpc_async_concurrent", test_grpc_async_concurrent, address, model),
+    ]
+    return _run_serial_section("gRPC-Specific Tests", "gRPC", tests, maxfail, stream)
 
 
 def main():
@@ -297,6 +628,12 @@ def main():
     parser.add_argument("--grpc-only", action="store_true", help="Only run gRPC tests")
     parser.add_argument("--api-key", default=None, help="API key if configured")
     parser.add_argument("--model", default=None, help="Model family to use (interactive picker if not specified)")
+    parser.add_argument("--maxfail", type=int, default=0, metavar="N",
+                        help="Skip a transport's remaining tests after N consecutive failures (0 = never)")
+    parser.add_argument("--full", action="store_true",
+                        help="Also run chat_simple/chat_with_model/chat_full individually (covered by chat_batch)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Print each result as it completes instead of one block per section")
     args = parser.parse_args()
 
     all_results: list[TestResult] = []
@@ -304,8 +641,9 @@ def main():
     # ── HTTP Tests ────────────────────────────────────────────────────────
 
     if not args.grpc_only:
-        from copilot_client import CopilotClient
-        http_client = CopilotClient(base_url=args.base_url, api_key=args.api_key)
+        # status/list_models are cached briefly, so the probe below also serves test_status
+        http_client = CopilotClient(base_url=args.base_url, api_key=args.api_key, metadata_ttl=5.0)
+        atexit.register(http_client.close)
 
         # First check connectivity
         print(f"\nConnecting to HTTP server at {args.base_url}...")
@@ -324,8 +662,10 @@ def main():
             selected_model = pick_model_interactive(http_client)
         print(f"\n  Using model: {selected_model}\n")
 
-        all_results.extend(run_interface_tests(http_client, "HTTP", selected_model))
-        all_results.extend(run_http_specific_tests(args.base_url))
+        all_results.extend(run_interface_tests(
+            http_client, "HTTP", selected_model, args.full, args.maxfail, args.stream,
+        ))
+        all_results.extend(run_http_specific_tests(http_client, selected_model, args.maxfail, args.stream))
 
     # ── gRPC Tests ────────────────────────────────────────────────────────
 
@@ -334,47 +674,67 @@ def main():
             from copilot_grpc_client import CopilotGrpcClient
 
             print(f"\nConnecting to gRPC server at {args.grpc_address}...")
-            grpc_client = CopilotGrpcClient(address=args.grpc_address)
+            # One client (and its shared channel) for the whole run, released at exit
+            grpc_client = CopilotGrpcClient(address=args.grpc_address, metadata_ttl=5.0)
+            atexit.register(grpc_client.close)
 
             try:
                 s = grpc_client.status()
                 print(f"  Connected! Server version: {s.version}")
-                all_results.extend(run_interface_tests(grpc_client, "gRPC", selected_model if 'selected_model' in dir() else None))
+                grpc_model = selected_model if 'selected_model' in dir() else None
+                all_results.extend(run_interface_tests(
+                    grpc_client, "gRPC", grpc_model, args.full, args.maxfail, args.stream,
+                ))
+                all_results.extend(run_grpc_specific_tests(args.grpc_address, grpc_model, args.maxfail, args.stream))
             except Exception as e:
                 print(f"  gRPC connection failed: {e}")
                 print("  Skipping gRPC tests. To enable: install @grpc/grpc-js in the extension and generate Python stubs.")
-            finally:
-                grpc_client.close()
 
         except ImportError as e:
             print(f"\n  gRPC tests skipped — missing dependencies: {e}")
             print("  To enable gRPC tests:")
             print("    pip install grpcio grpcio-tools")
             print("    python -m grpc_tools.protoc -I proto --python_out=clients/python --grpc_python_out=clients/python proto/copilot_bridge.proto")
+    else:
+        # --http-only must never pay for grpcio; catch an eager import sneaking in
+        grpc_imported = "grpc" in sys.modules
+        result = TestResult(
+            "HTTP::no_grpc_import", not grpc_imported,
+            "grpc was imported during an --http-only run" if grpc_imported else "grpc not imported",
+        )
+        all_results.append(result)
+        print(result)
 
     # ── Summary ───────────────────────────────────────────────────────────
 
-    print(f"\n{'=' * 60}")
-    print(f"  TEST SUMMARY")
-    print(f"{'=' * 60}")
-
-    passed = sum(1 for r in all_results if r.passed)
-    failed = sum(1 for r in all_results if not r.passed)
-    total = len(all_results)
-    total_time = sum(r.duration for r in all_results)
-
-    print(f"  Total:  {total}")
-    print(f"  Passed: {passed}")
-    print(f"  Failed: {failed}")
-    print(f"  Time:   {total_time:.2f}s")
+    passed = 0
+    total_time = 0.0
+    failures: list[TestResult] = []
+    for r in all_results:
+        total_time += r.duration
+        if r.passed:
+            passed += 1
+        else:
+            failures.append(r)
+    failed = len(failures)
+    total = passed + failed
+
+    report = _Report(args.stream)
+    report.line(f"\n{'=' * 60}")
+    report.line(f"  TEST SUMMARY")
+    report.line(f"{'=' * 60}")
+    report.line(f"  Total:  {total}")
+    report.line(f"  Passed: {passed}")
+    report.line(f"  Failed: {failed}")
+    report.line(f"  Time:   {total_time:.2f}s")
 
     if failed > 0:
-        print(f"\n  Failed tests:")
-        for r in all_results:
-            if not r.passed:
-                print(f"    - {r.name}: {r.message}")
+        report.line(f"\n  Failed tests:")
+        for r in failures:
+            report.line(f"    - {r.name}: {r.message}")
 
-    print()
+    report.line()
+    report.flush()
     sys.exit(0 if failed == 0 else 1)
 
 